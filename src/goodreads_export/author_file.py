@@ -1,5 +1,6 @@
 """Author's object."""
 
+import sys
 import urllib.parse
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 class AuthorFile(DataFile):
     """Author's object."""
 
+    __slots__ = ("name", "names", "series", "books")
+
     name: str  # primary author name
     names: list[str]
     series: SeriesList
@@ -54,16 +57,18 @@ class AuthorFile(DataFile):
         """Parse file content."""
         assert self._content is not None, "Cannot parse None content"
         self.names = []
-        if regex := self._get_template().names_regexes.choose_regex(self._content):
-            self.names = [
-                match[regex.name_group]
+        # the first regex with matches, scanning the content only once per regex
+        for regex in self._get_template().names_regexes:
+            if names := [
+                sys.intern(match[regex.name_group])
                 for match in regex.compiled.finditer(self._content)
-            ]
-            self.name = self.names[0]  # first name is primary
-        else:
-            raise ParseError(
-                f"Cannot extract author information from file content:\n{self._content}"
-            )
+            ]:
+                self.names = names
+                self.name = self.names[0]  # first name is primary
+                return
+        raise ParseError(
+            f"Cannot extract author information from file content:\n{self._content}"
+        )
 
     def merge(self, other: "AuthorFile") -> None:
         """Merge `other` author with this one."""
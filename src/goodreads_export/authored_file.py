@@ -1,6 +1,8 @@
 """Library object with author."""
 
+import os
 from abc import ABC
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 from goodreads_export.data_file import DataFile
@@ -12,6 +14,8 @@ if TYPE_CHECKING:
 class AuthoredFile(DataFile, ABC):
     """Authored data file."""
 
+    __slots__ = ("author",)
+
     author: "AuthorFile"
 
     def __init__(self, *, author: Optional["AuthorFile"] = None, **kwargs: Any) -> None:
@@ -24,10 +28,31 @@ class AuthoredFile(DataFile, ABC):
         """Rename author.
 
         We do not re-render the file fully to keep intact possible user changes in it.
+        The file with the new name is written before the old one is deleted.
         """
-        self.delete_file()
+        old_path = self.path
         old_author_link = self.author.file_link
         self.author = self.library.author_factory(new_author)
         self._file_name = None  # to force re-rendering
         self._content = self.content.replace(old_author_link, self.author.file_link)
+        if self._is_same_file(self.path, old_path):
+            self._delete_path(old_path)  # so it is not taken for a file name collision
         self.write()
+        # the written file name could get book ID suffix and become the old one
+        if not self._is_same_file(self.path, old_path):
+            self._delete_path(old_path)
+
+    @staticmethod
+    def _is_same_file(path: Path, other: Path) -> bool:
+        """Check if the paths refer to the same file.
+
+        Names differing only by case are the same file on case-insensitive file systems.
+        """
+        return path == other or (
+            path.exists() and other.exists() and os.path.samefile(path, other)
+        )
+
+    def _delete_path(self, path: Path) -> None:
+        """Delete the file at `path` if it exists."""
+        path.unlink(missing_ok=True)
+        self.library.file_removed(path)
@@ -13,14 +13,27 @@ from goodreads_export.templates import BookTemplate
 class BookFile(AuthoredFile):  # pylint: disable=too-many-instance-attributes
     """Book's object."""
 
+    __slots__ = (
+        "title",
+        "book_id",
+        "tags",
+        "rating",
+        "isbn",
+        "isbn13",
+        "_review",
+        "_series_titles",
+        "_details_parsed",
+    )
+
     title: Optional[str]
     book_id: Optional[str]
     tags: List[str]
     rating: Optional[int]
     isbn: Optional[int]
     isbn13: Optional[int]
-    review: Optional[str]
-    series_titles: List[str]
+    _review: Optional[str]
+    _series_titles: List[str]
+    _details_parsed: bool  # series and review are parsed from content on demand
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -42,8 +55,9 @@ class BookFile(AuthoredFile):  # pylint: disable=too-many-instance-attributes
         self.rating = rating
         self.isbn = isbn
         self.isbn13 = isbn13
-        self.review = review
-        self.series_titles = series_titles or []
+        self._review = review
+        self._series_titles = series_titles or []
+        self._details_parsed = True
         super().__init__(**kwargs)
 
     def _get_template(self) -> BookTemplate:
@@ -59,17 +73,14 @@ class BookFile(AuthoredFile):  # pylint: disable=too-many-instance-attributes
         }
 
     def parse(self) -> None:
-        """Parse file content."""
-        assert self._content is not None, "Cannot parse None content"
-        self.series_titles = []
-        if book_regex := self._get_template().goodreads_link_regexes.choose_regex(
-            self._content
-        ):
-            link_match = book_regex.compiled.search(self._content)
-            assert link_match is not None, (
-                "impossible happened: after successful `search` in "
-                "`choose_regex` got `None` for search with same params"
-            )
+        """Parse file content.
+
+        Series and review are parsed on first access.
+        """
+        content = self._content
+        assert content is not None, "Cannot parse None content"
+        if found := self._get_template().goodreads_link_regexes.search(content):
+            book_regex, link_match = found
             self.book_id = link_match[book_regex.book_id_group]
             self.title = link_match[book_regex.title_group]
             self.author = self.library.author_factory(
@@ -77,22 +88,53 @@ class BookFile(AuthoredFile):  # pylint: disable=too-many-instance-attributes
             )
         else:
             raise ParseError(
-                f"Cannot extract book information from file content:\n{self._content}"
+                f"Cannot extract book information from file content:\n{content}"
             )
-        if series_regex := self._get_template().series_regexes.choose_regex(
-            self._content
-        ):
-            self.series_titles = [
+        self._details_parsed = False
+
+    def _parse_details(self) -> None:
+        """Parse series and review from file content."""
+        content = self._content
+        assert content is not None, "Cannot parse None content"
+        template = self._get_template()
+        self._details_parsed = True
+        self._series_titles = []
+        if series_regex := template.series_regexes.choose_regex(content):
+            self._series_titles = [
                 series_match[series_regex.series_group]
-                for series_match in series_regex.compiled.finditer(self._content)
+                for series_match in series_regex.compiled.finditer(content)
             ]
-        if review_regex := self._get_template().review_regexes.choose_regex(
-            self._content
-        ):
-            if review_match := review_regex.compiled.search(self._content):
-                self.review = review_match[review_regex.review_group].strip()
-            else:
-                self.review = ""
+        if found := template.review_regexes.search(content):
+            review_regex, review_match = found
+            self._review = review_match[review_regex.review_group].strip()
+
+    @property
+    def series_titles(self) -> List[str]:
+        """Series titles."""
+        if not self._details_parsed:
+            self._parse_details()
+        return self._series_titles
+
+    @series_titles.setter
+    def series_titles(self, series_titles: List[str]) -> None:
+        """Set series titles."""
+        if not self._details_parsed:
+            self._parse_details()
+        self._series_titles = series_titles
+
+    @property
+    def review(self) -> Optional[str]:
+        """Review text."""
+        if not self._details_parsed:
+            self._parse_details()
+        return self._review
+
+    @review.setter
+    def review(self, review: Optional[str]) -> None:
+        """Set review text."""
+        if not self._details_parsed:
+            self._parse_details()
+        self._review = review
 
     def write(self) -> None:
         """Write markdown file to path.
@@ -119,9 +161,9 @@ class BookFile(AuthoredFile):  # pylint: disable=too-many-instance-attributes
         """
         created_series_files = {}
         for series in self.series:
-            if not series.path.is_file():
-                series.write()
-                created_series_files[series.title] = series.path
+            series_path = series.path
+            if not self.library.is_file(series_path) and series.create():
+                created_series_files[series.title] = series_path
         return created_series_files
 
     def check(self) -> bool:
@@ -1,6 +1,7 @@
 """Make file name safe for cloud disks."""
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Union
 
 FILE_NAME_REPLACE_MAP = {
     "%": " percent",
@@ -18,6 +19,7 @@ FILE_NAME_REPLACE_MAP = {
     "|": "_",
     "#": "@",
 }
+FILE_NAME_TRANSLATION = str.maketrans(FILE_NAME_REPLACE_MAP)
 
 
 def clean_file_name(
@@ -25,5 +27,15 @@ def clean_file_name(
 ) -> str:
     """Replace chars unsafe for file name in MS OneDrive etc."""
     if replace_map is None:
-        replace_map = FILE_NAME_REPLACE_MAP
-    return "".join(replace_map.get(ch, ch) for ch in file_name)
+        return _clean_file_name(file_name)
+    translation: Dict[str, Union[str, int, None]] = {**replace_map}
+    return file_name.translate(str.maketrans(translation))
+
+
+@lru_cache(maxsize=8192)
+def _clean_file_name(file_name: str) -> str:
+    """Clean file name with the default replace map.
+
+    The same author and series names are cleaned for every book file.
+    """
+    return file_name.translate(FILE_NAME_TRANSLATION)
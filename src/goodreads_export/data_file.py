@@ -17,6 +17,8 @@ class ParseError(Exception):
 class DataFile:
     """Object stored in the file."""
 
+    __slots__ = ("library", "folder", "_file_name", "_content")
+
     library: "Library"
     folder: Optional[Path]
 
@@ -96,6 +98,7 @@ class DataFile:
         """Delete the series file."""
         if self.path.exists():
             os.remove(self.path)
+            self.library.file_removed(self.path)
 
     @property
     def path(self) -> Path:
@@ -106,6 +109,23 @@ class DataFile:
     def write(self) -> None:
         """Write file to path."""
         self.path.write_text(self.content, encoding="utf8")
+        self.library.file_added(self.path)
+
+    def create(self) -> bool:
+        """Write file to path if there is no such file.
+
+        Return True if the file was created.
+        """
+        content = self.content
+        try:
+            with self.path.open("x", encoding="utf8") as file:
+                file.write(content)
+        except FileExistsError:
+            created = False
+        else:
+            created = True
+        self.library.file_added(self.path)
+        return created
 
     def check_regexes(
         self, checks: Dict[str, Dict[str, Any]], default_regex: str
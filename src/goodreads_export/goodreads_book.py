@@ -1,7 +1,10 @@
 """Goodreads export CSV parser."""
 
+import queue
 import re
-from typing import List
+import sys
+import threading
+from typing import Any, Iterator, Mapping, Optional
 
 import markdownify
 import pandas as pd
@@ -17,14 +20,20 @@ EXPECTED_COLUMNS = {
     "ISBN13",
 }
 
+BOOKS_QUEUE_SIZE = 1024  # converted books waiting to be saved
+
+SERIES_LIST_REGEX = re.compile(r"\(([^)\n]*)\)")  # `(series, #1; series, #2)` in title
+SERIES_REGEX = re.compile(r"([^#;]*), #\d+(;|$)")  # `series, #1` in series list
+
 
 class Book:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Extract book description from goodreads export."""
 
-    def __init__(self, goodreads: pd.Series) -> None:
+    def __init__(self, goodreads: Mapping[str, Any]) -> None:
         """Init the object from goodreads export."""
         self.title = goodreads["Title"]
-        self.author = goodreads["Author"]
+        author = goodreads["Author"]  # empty cell is NaN
+        self.author = sys.intern(author) if isinstance(author, str) else author
         self.book_id = str(goodreads["Book Id"])
         self.rating = goodreads["My Rating"]
         if isinstance(goodreads["My Review"], str):
@@ -46,30 +55,86 @@ class Book:  # pylint: disable=too-few-public-methods,too-many-instance-attribut
                 self.tags.append(rating_tag)
         self.isbn = goodreads["ISBN"]
         self.isbn13 = goodreads["ISBN13"]
-        if series_list_match := re.search(r"\(([^)\n]*)\)", self.title):
-            series_match = re.finditer(r"([^#;]*), #\d+(;|$)", series_list_match[1])
+        if series_list_match := SERIES_LIST_REGEX.search(self.title):
+            series_match = SERIES_REGEX.finditer(series_list_match[1])
             self.series = [series[1].strip() for series in series_match]
         else:
             self.series = []
-        self.series_full = [
-            f"{self.author} - {series} - series" for series in self.series
-        ]
 
 
-class GoodreadsBooks(List[Book]):
-    """List of books from goodreads export."""
+class GoodreadsBooks:
+    """Books from goodreads export.
+
+    Book objects are created from the export rows on iteration.
+    """
 
     def __init__(self, csv_file: str) -> None:
-        """Load books from goodreads export."""
-        books_df = self.load_reviews(csv_file)
-        super().__init__([Book(row) for _, row in books_df.iterrows()])
+        """Load goodreads export."""
+        self.reviews = self.load_reviews(csv_file)
+
+    def __len__(self) -> int:
+        """Number of books in the export."""
+        return len(self.reviews)
+
+    def __iter__(self) -> Iterator[Book]:
+        """Books in the order of the export file."""
+        columns = list(self.reviews.columns)
+        for row in self.reviews.itertuples(index=False, name=None):
+            yield Book(dict(zip(columns, row)))
 
     @staticmethod
     def load_reviews(csv_file: str) -> pd.DataFrame:
         """Load goodreads books info from CSV export."""
-        reviews = pd.read_csv(csv_file)
+        reviews = pd.read_csv(
+            csv_file,
+            engine="c",
+            memory_map=True,
+            usecols=lambda column: column in EXPECTED_COLUMNS,
+        )
         assert EXPECTED_COLUMNS.issubset(reviews.columns), (
             f"Wrong goodreads export file.\n "
             f"Columns {EXPECTED_COLUMNS - set(reviews.columns)} were not found."
         )
         return reviews
+
+
+class GoodreadsBooksQueue:
+    """Books from goodreads export converted in a background thread.
+
+    Conversion (mostly reviews markdownify) runs while the library is loading.
+    Converted books wait in a bounded queue until consumed by iteration.
+    Could be iterated only once.
+    """
+
+    def __init__(self, csv_file: str, max_size: int = BOOKS_QUEUE_SIZE) -> None:
+        """Load goodreads export and start conversion thread."""
+        self.books = GoodreadsBooks(csv_file)
+        self._queue: "queue.Queue[Optional[Book]]" = queue.Queue(maxsize=max_size)
+        self._error: Optional[BaseException] = None
+        self._consumed = False
+        self._producer = threading.Thread(target=self._produce, daemon=True)
+        self._producer.start()
+
+    def __len__(self) -> int:
+        """Number of books in the export."""
+        return len(self.books)
+
+    def _produce(self) -> None:
+        """Convert rows to books, `None` marks the end of the queue."""
+        try:
+            for book in self.books:
+                self._queue.put(book)
+        except Exception as exc:  # pylint: disable=broad-except
+            self._error = exc  # re-raised in the consumer thread
+        finally:
+            self._queue.put(None)
+
+    def __iter__(self) -> Iterator[Book]:
+        """Books in the order of the export file."""
+        if self._consumed:
+            raise RuntimeError("Goodreads books queue could be iterated only once")
+        self._consumed = True
+        while (book := self._queue.get()) is not None:
+            yield book
+        if self._error is not None:
+            raise self._error
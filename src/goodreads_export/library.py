@@ -1,25 +1,87 @@
 """Library of books."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from goodreads_export.author_file import AuthorFile
 from goodreads_export.book_file import BookFile
 from goodreads_export.data_file import ParseError
-from goodreads_export.goodreads_book import Book, GoodreadsBooks
+from goodreads_export.goodreads_book import Book, GoodreadsBooks, GoodreadsBooksQueue
 from goodreads_export.log import Log
 from goodreads_export.series_file import SeriesFile
 from goodreads_export.stat import Stat
 from goodreads_export.templates import TemplateSet, TemplatesLoader
 
-SUBFOLDERS = {
-    "toread": "toread",  # for books without review and rating - supposedly this is from to-read
-    "reviews": "reviews",  # all other books
-    "authors": "authors",  # book authors
-}
+# for books without review and rating - supposedly this is from to-read
+TOREAD_SUBFOLDER = "toread"
+REVIEWS_SUBFOLDER = "reviews"  # all other books
+AUTHORS_SUBFOLDER = "authors"  # book authors
+SUBFOLDERS = (TOREAD_SUBFOLDER, REVIEWS_SUBFOLDER, AUTHORS_SUBFOLDER)
 
-BOOKS_SUBFOLDERS = [SUBFOLDERS["reviews"], SUBFOLDERS["toread"]]
+BOOKS_SUBFOLDERS = (REVIEWS_SUBFOLDER, TOREAD_SUBFOLDER)
+
+PROGRESS_STEP = 16  # books between review progress bar updates
+PARALLEL_READ_MIN_FILES = 200  # read smaller folders without thread pool
+
+
+def scan_files(folder: Path, suffix: str) -> Iterator["os.DirEntry[str]"]:
+    """Files in the `folder` with names ending with `suffix`.
+
+    Missing folder is the same as empty one.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+def read_text(path: str) -> str:
+    """Read file content."""
+    with open(path, encoding="utf8") as file:
+        return file.read()
+
+
+def read_files(folder: Path, suffix: str) -> List[Tuple["os.DirEntry[str]", str]]:
+    """Read the `folder` files with names ending with `suffix`.
+
+    Return [(file entry, file content)].
+    """
+    return read_entries(list(scan_files(folder, suffix)))
+
+
+def read_entries(
+    entries: List["os.DirEntry[str]"],
+) -> List[Tuple["os.DirEntry[str]", str]]:
+    """Read the files.
+
+    Return [(file entry, file content)].
+    Big lists of files are read by a thread pool to overlap I/O waits.
+    """
+    paths = [entry.path for entry in entries]
+    if len(paths) < PARALLEL_READ_MIN_FILES:
+        return list(zip(entries, map(read_text, paths)))
+    with ThreadPoolExecutor() as executor:
+        contents = list(executor.map(read_text, paths))
+    return list(zip(entries, contents))
+
+
+def duplicate_book_error(loaded: List[Tuple[str, BookFile]]) -> ValueError:
+    """Error for the first book ID that repeats in `loaded`."""
+    seen: Dict[str, BookFile] = {}
+    for book_id, book in loaded:
+        if book_id in seen:
+            return ValueError(
+                f"Duplicate book ID {book_id} in {book.path} "
+                f"and {seen[book_id].file_name}"
+            )
+        seen[book_id] = book
+    return ValueError("Duplicate book ID")
 
 
 def normalize_review(review: str | None) -> str:
@@ -61,13 +123,21 @@ class Library:
 
         self.books: Dict[str, BookFile] = {}
         self.authors: Dict[str, AuthorFile] = {}
-        self.primary_authors: Dict[str, AuthorFile] = {}
+        self.primary_authors: Dict[str, AuthorFile] = {}  # authors with synonyms
+        self.folder_files: Dict[Path, Set[str]] = {}  # {scanned folder: file names}
+        self.ensured_folders: Set[str] = set()  # absolute paths of folders created
+        self.subfolders: Dict[str, Path] = {}  # {subfolder name: path}
         if folder is not None:
-            self.authors = self.load_authors(folder / SUBFOLDERS["authors"])
+            self.subfolders = {
+                subfolder: folder / subfolder for subfolder in SUBFOLDERS
+            }
+            self.authors = self.load_authors(self.subfolders[AUTHORS_SUBFOLDER])
             for books_subfolder in BOOKS_SUBFOLDERS:
-                self.load_series(folder / books_subfolder, self.authors)
+                self.load_series(self.subfolders[books_subfolder], self.authors)
             for books_subfolder in BOOKS_SUBFOLDERS:
-                self.books |= self.load_books(folder / books_subfolder, self.authors)
+                self.load_books(
+                    self.subfolders[books_subfolder], self.authors, self.books
+                )
 
     def merge_author_names(self) -> None:
         """Replace all author names (translations, misspellings) with `primary` name.
@@ -80,11 +150,9 @@ class Library:
         the `primary` name.
         Author files with `non-primary` names will be deleted.
         """
-        for primary_author in [
-            author
-            for author in self.authors.values()
-            if len(set(author.names) - {author.name}) > 0
-        ]:
+        if not self.primary_authors:
+            return
+        for primary_author in self.primary_authors.values():
             for author_name in primary_author.names:
                 if (
                     author_name in self.authors
@@ -97,11 +165,18 @@ class Library:
                     primary_author.merge(self.authors[author_name])
                     self.authors[author_name] = primary_author
 
-    def dump(self, books: GoodreadsBooks) -> None:
+    def dump(self, books: Union[GoodreadsBooks, GoodreadsBooksQueue]) -> None:
         """Save `books` to the library folder."""
         assert self.folder is not None, "Cannot save books to None folder"
-        for subfolder in SUBFOLDERS.values():
-            os.makedirs(self.folder / subfolder, exist_ok=True)
+        for subfolder_path in self.subfolders.values():
+            self.ensure_folder(subfolder_path)
+
+        # authors added while dumping are always registered under primary names
+        primary_names = {
+            name: author.name
+            for name, author in self.authors.items()
+            if name != author.name
+        }
 
         reviews_bar_title = "Review"
         authors_bar_title = "Author"
@@ -110,14 +185,15 @@ class Library:
             authors_bar_title, "authors", bar_format="{desc}: {n_fmt}"
         )
 
-        for book in books:
-            self.log.progress(reviews_bar_title)
-            self.log.progress_description(reviews_bar_title, f"{book.title}")
+        progress_step = 1 if self.log.verbose else PROGRESS_STEP
+        books_num = 0
+        for books_num, book in enumerate(books, start=1):
+            if books_num % progress_step == 0:
+                self.log.progress(reviews_bar_title, progress_step)
+                self.log.progress_description(reviews_bar_title, f"{book.title}")
             if self.stat.register_author(book.author):
                 self.log.progress(authors_bar_title)
-            if book.author in self.authors and book.author != (
-                primary_author := self.authors[book.author].name
-            ):
+            if primary_author := primary_names.get(book.author):
                 self.log.progress_description(
                     authors_bar_title,
                     f"Author name `{book.author}` changed to `{primary_author}`",
@@ -125,8 +201,7 @@ class Library:
                 book.author = primary_author
 
             need_book_update = False
-            if book.book_id in self.books:
-                existing_book = self.books[book.book_id]
+            if (existing_book := self.books.get(book.book_id)) is not None:
                 if normalize_review(existing_book.review) != normalize_review(
                     book.review
                 ):
@@ -137,7 +212,7 @@ class Library:
                     existing_book.delete_file()
                     need_book_update = True
 
-            if book.book_id not in self.books or need_book_update:
+            if existing_book is None or need_book_update:
                 if book.author not in self.authors:
                     self.authors[book.author] = self.create_author_file(book)
                     self.stat.authors_added += 1
@@ -147,8 +222,16 @@ class Library:
                 added_file_path = self.create_book_file(book)
                 self.stat.books_added += 1
                 self.log.debug(f"Saved book `{book.title}` to file {added_file_path} ")
+        self.log.progress(reviews_bar_title, books_num % progress_step)
         self.log.close_progress()
 
+    def ensure_folder(self, folder: Path) -> None:
+        """Create the `folder` if it was not yet created by this library."""
+        folder_key = os.path.abspath(folder)
+        if folder_key not in self.ensured_folders:
+            os.makedirs(folder, exist_ok=True)
+            self.ensured_folders.add(folder_key)
+
     def create_book_file(self, book: Book) -> str:
         """Create book file.
 
@@ -157,14 +240,14 @@ class Library:
         assert self.folder is not None, "Cannot save books to None folder"
 
         if book.review == "" and book.rating == 0:
-            subfolder = SUBFOLDERS["toread"]
+            subfolder = TOREAD_SUBFOLDER
         else:
-            subfolder = SUBFOLDERS["reviews"]
+            subfolder = REVIEWS_SUBFOLDER
 
         book_file = BookFile(
             library=self,
             title=book.title,
-            folder=self.folder / subfolder,
+            folder=self.subfolders[subfolder],
             tags=book.tags,
             author=self.author_factory(book.author),
             book_id=book.book_id,
@@ -189,10 +272,10 @@ class Library:
         author_file = AuthorFile(
             library=self,
             name=book.author,
-            folder=self.folder / SUBFOLDERS["authors"],
+            folder=self.subfolders[AUTHORS_SUBFOLDER],
         )
-        if not author_file.path.is_file():
-            author_file.write()
+        if not self.is_file(author_file.path):
+            author_file.create()
         return author_file
 
     def author_factory(self, name: str) -> AuthorFile:
@@ -206,33 +289,56 @@ class Library:
                 return AuthorFile(library=self, name=name)
             self.log.info(f"Creating author '{name}' ")
             self.authors[name] = AuthorFile(
-                library=self, name=name, folder=self.folder / SUBFOLDERS["authors"]
+                library=self, name=name, folder=self.subfolders[AUTHORS_SUBFOLDER]
             )
             self.authors[name].write()
         return self.authors[name]
 
-    def book_file_mask(self) -> str:
-        """Return Book file mask."""
+    def is_file(self, path: Path) -> bool:
+        """Check if the file exists.
+
+        For the folders scanned on load use collected file names instead of disk access.
+        """
+        if (file_names := self.folder_files.get(path.parent)) is not None:
+            return path.name in file_names
+        return path.is_file()
+
+    def file_added(self, path: Path) -> None:
+        """Register written file."""
+        if (file_names := self.folder_files.get(path.parent)) is not None:
+            file_names.add(path.name)
+
+    def file_removed(self, path: Path) -> None:
+        """Register deleted file."""
+        if (file_names := self.folder_files.get(path.parent)) is not None:
+            file_names.discard(path.name)
+
+    @cached_property
+    def book_file_suffix(self) -> str:
+        """Book file suffix, rendered once from the templates."""
         dummy_author = AuthorFile(library=self, name="author")
         dummy_book = BookFile(library=self, author=dummy_author, title="title")
-        return f"*{dummy_book.file_name.suffix}"
+        return dummy_book.file_name.suffix
 
-    def author_file_mask(self) -> str:
-        """Return Author file mask."""
+    @cached_property
+    def author_file_suffix(self) -> str:
+        """Author file suffix, rendered once from the templates."""
         dummy_author = AuthorFile(library=self, name="author")
-        return f"*{dummy_author.file_name.suffix}"
+        return dummy_author.file_name.suffix
 
-    def series_file_mask(self) -> str:
-        """Return Book file mask."""
+    @cached_property
+    def series_file_suffix(self) -> str:
+        """Series file suffix, rendered once from the templates."""
         dummy_author = AuthorFile(library=self, name="author")
         dummy_series = SeriesFile(library=self, author=dummy_author, title="title")
-        return f"*{dummy_series.file_name.suffix}"
+        return dummy_series.file_name.suffix
 
-    def is_series_file_name(self, file_name: Path) -> bool:
+    def is_series_file_name(self, file_name: Union[str, Path]) -> bool:
         """Return True if file_name is series file name."""
-        dummy_author = AuthorFile(library=self, name="author")
-        dummy_series = SeriesFile(library=self, author=dummy_author, title="title")
-        return dummy_series.is_file_name(file_name)
+        return (
+            self.templates.series.file_name_regexes.choose_regex(str(file_name))
+            is not None
+        )
 
     def load_series(self, folder: Path, authors: Dict[str, AuthorFile]) -> None:
         """Load existed series.
@@ -240,58 +346,63 @@ class Library:
         Add them to authors.
         Could add series with the same title to the same author if they are in different files.
         """
-        dummy_author = AuthorFile(library=Library(), name="author", folder=folder)
-        dummy_series = SeriesFile(library=Library(), author=dummy_author, title="title")
-        for file_name in folder.glob(self.series_file_mask()):
-            if dummy_series.is_file_name(file_name):
-                try:
-                    series = SeriesFile(
-                        library=self,
-                        folder=folder,
-                        file_name=Path(file_name.name),
-                        content=file_name.read_text(encoding="utf8"),
-                    )
-                except ParseError:
-                    self.log.info(f"Series file {file_name} has no author name")
-                    continue
-                if series.author.name not in authors:
-                    self.log.info(
-                        f"Series file {file_name} has author without author file"
-                    )
-                    continue
-                authors[series.author.name].series.append(series)
-                self.stat.series_added += 1
+        entries = list(scan_files(folder, self.series_file_suffix))
+        self.folder_files.setdefault(folder, set()).update(
+            entry.name for entry in entries
+        )
+        series_entries = [
+            entry for entry in entries if self.is_series_file_name(entry.name)
+        ]
+        for entry, content in read_entries(series_entries):
+            try:
+                series = SeriesFile(
+                    library=self,
+                    folder=folder,
+                    file_name=Path(entry.name),
+                    content=content,
+                )
+            except ParseError:
+                self.log.info(f"Series file {entry.path} has no author name")
+                continue
+            if series.author.name not in authors:
+                self.log.info(
+                    f"Series file {entry.path} has author without author file"
+                )
+                continue
+            authors[series.author.name].series.append(series)
+            self.stat.series_added += 1
 
     def load_books(
-        self, folder: Path, authors: Dict[str, AuthorFile]
-    ) -> Dict[str, BookFile]:
+        self, folder: Path, authors: Dict[str, AuthorFile], books: Dict[str, BookFile]
+    ) -> None:
         """Load existed books.
 
         Look for goodreads book ID inside files.
-        Return {id: BookFile} for files with book ID, ignore other files.
+        Add {id: BookFile} to `books` for files with book ID, ignore other files.
         This way we ignore "- series" files and unknown files.
         """
-        books: Dict[str, BookFile] = {}
-        for file_name in folder.glob(self.book_file_mask()):
+        file_names = self.folder_files.setdefault(folder, set())
+        loaded: List[Tuple[str, BookFile]] = []
+        for entry, content in read_files(folder, self.book_file_suffix):
+            file_names.add(entry.name)
             try:
                 book = BookFile(  # also create author file if not yet existed
                     library=self,
                     folder=folder,
-                    file_name=Path(file_name.name),
-                    content=file_name.read_text(encoding="utf8"),
+                    file_name=Path(entry.name),
+                    content=content,
                 )
                 assert book.book_id is not None, "Book ID is None for file {file_name}"
-                if book.book_id in books:
-                    raise ValueError(
-                        f"Duplicate book ID {book.book_id} in {file_name} "
-                        f"and {books[book.book_id].file_name}"
-                    )
-                books[book.book_id] = book
-                authors[book.author.name].books.append(book)
+                loaded.append((book.book_id, book))
             except ParseError:
-                if not self.is_series_file_name(file_name):
+                if not self.is_series_file_name(entry.name):
                     self.stat.skipped_unknown_files += 1
-        return books
+        loaded_books = dict(loaded)
+        if len(loaded_books) != len(loaded):
+            raise duplicate_book_error(loaded)
+        books.update(loaded_books)  # book from a later folder replaces the same ID
+        for _, book in loaded:
+            authors[book.author.name].books.append(book)
 
     def load_authors(self, folder: Path) -> Dict[str, AuthorFile]:
         """Load existed authors.
@@ -299,25 +410,30 @@ class Library:
         Return loaded authors
         """
         authors: Dict[str, AuthorFile] = {}
-        for file_name in folder.glob(self.author_file_mask()):
-            author = AuthorFile(
-                library=self,
-                folder=folder,
-                file_name=Path(file_name.name),
-                name=file_name.stem,  # will be replaced by parsing file content
-                content=file_name.read_text(encoding="utf8"),
-            )
-            if author.names:  # parse succeeded
-                authors[author.name] = (
-                    author  # primary name is always point to primary file
+        suffix = self.author_file_suffix
+        file_names = self.folder_files.setdefault(folder, set())
+        for entry, content in read_files(folder, suffix):
+            file_names.add(entry.name)
+            try:
+                author = AuthorFile(
+                    library=self,
+                    folder=folder,
+                    file_name=Path(entry.name),
+                    # will be replaced by parsing file content
+                    name=entry.name[: len(entry.name) - len(suffix)],
+                    content=content,
                 )
-                for name in author.names:
-                    if (
-                        name not in authors
-                    ):  # do not overwrite if pointed to primary file
-                        authors[name] = author
-            else:
+            except ParseError:
                 self.stat.skipped_unknown_files += 1
+                continue
+            authors[author.name] = (
+                author  # primary name is always point to primary file
+            )
+            if len(set(author.names) - {author.name}) > 0:
+                self.primary_authors[author.name] = author
+            for name in author.names:
+                if name not in authors:  # do not overwrite if pointed to primary file
+                    authors[name] = author
         return authors
 
     def check_templates(self) -> None:
@@ -1,11 +1,14 @@
 """Logger."""
 
 import os
+import time
 from textwrap import shorten
 from typing import Dict, Optional, List
 
 from tqdm import tqdm
 
+DESCRIPTION_REFRESH_INTERVAL = 0.1  # seconds between progress bar description redraws
+
 
 class Log:
     """Logger.
@@ -22,6 +25,13 @@ class Log:
     def __init__(self, verbose: bool = False) -> None:
         """Initialize logger."""
         self._verbose = verbose
+        self.terminal_width = 80
+        self.description_refreshed: Dict[str, float] = {}  # {title: last redraw time}
+
+    @property
+    def verbose(self) -> bool:
+        """Verbose mode."""
+        return self._verbose
 
     @staticmethod
     def get_terminal_width() -> int:
@@ -45,6 +55,8 @@ class Log:
         """Open progress bar."""
         self.in_progress = True
         if not self._verbose:
+            self.terminal_width = self.get_terminal_width()
+            self.description_refreshed[title] = 0.0
             self.progress_bar[title] = {
                 "title": tqdm(
                     bar_format="{desc}", leave=False, position=self.position + 1
@@ -65,18 +77,25 @@ class Log:
         """Update progress bar description.
 
         Or log the message if we are in verbose mode.
+        The description is redrawn at most once per `DESCRIPTION_REFRESH_INTERVAL`.
         """
         if not self._verbose:
+            now = time.monotonic()
+            refresh = (
+                now - self.description_refreshed[title] >= DESCRIPTION_REFRESH_INTERVAL
+            )
+            if refresh:
+                self.description_refreshed[title] = now
             self.progress_bar[title]["title"].set_description_str(
-                shorten(message, self.get_terminal_width())
+                shorten(message, self.terminal_width), refresh=refresh
             )
         else:
             print(f"{title}: {message}")
 
-    def progress(self, title: str) -> None:
-        """Update progress bar."""
+    def progress(self, title: str, num: int = 1) -> None:
+        """Advance progress bar by `num` steps."""
         if not self._verbose:
-            self.progress_bar[title]["bar"].update()
+            self.progress_bar[title]["bar"].update(num)
 
     def close_progress(self) -> None:
         """Close progress bars."""
@@ -85,6 +104,7 @@ class Log:
                 progress_bar["bar"].close()
                 progress_bar["title"].close()
             self.progress_bar = {}
+            self.description_refreshed = {}
             self.position = 0
         self.in_progress = False
         if self.buffer:
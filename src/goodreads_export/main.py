@@ -8,7 +8,7 @@ from typing import Optional
 
 import rich_click as click
 
-from goodreads_export.goodreads_book import GoodreadsBooks
+from goodreads_export.goodreads_book import GoodreadsBooksQueue
 from goodreads_export.library import Library
 from goodreads_export.log import Log
 from goodreads_export.templates import (
@@ -55,7 +55,7 @@ BUILTIN_TEMPLATES_NAME_OPTION = click.option(
 
 BOOKS_FOLDER_OPTION = click.argument(
     "books_folder",
-    type=click.Path(exists=True, path_type=Path),
+    type=click.Path(path_type=Path),
     nargs=1,
 )
 
@@ -63,7 +63,7 @@ BOOKS_FOLDER_OPTION = click.argument(
 BOOKS_FOLDER_OPTIONAL_OPTION = click.argument(
     "books_folder",
     required=False,
-    type=click.Path(exists=True, path_type=Path),
+    type=click.Path(path_type=Path),
     nargs=1,
 )
 
@@ -79,10 +79,10 @@ def load_library(log: Log, books_folder: Path, templates: TemplateSet) -> Librar
     """Load library."""
     library = Library(folder=books_folder, log=log, templates=templates)
     log.start(f"Reading existing files from {books_folder}")
-    print(
+    sys.stdout.write(
         f" loaded {len(library.books)} books, {len(library.authors)} authors, "
         f"skipped {library.stat.skipped_unknown_files} unknown files"
-        f" and {library.stat.series_added} series files.",
+        f" and {library.stat.series_added} series files.\n"
     )
     return library
 
@@ -190,7 +190,7 @@ def import_(
     """
     try:
         log = Log(verbose)
-
+        books_folder = books_folder.resolve(strict=True)
         if os.path.isdir(
             csv_file
         ):  # if folder as csv_file try to find goodreads file in that folder
@@ -199,7 +199,7 @@ def import_(
             print(f"Goodreads export file '{csv_file}' not found.")
             sys.exit(1)
         log.start(f"Loading reviews from {csv_file}")
-        books = GoodreadsBooks(csv_file)
+        books = GoodreadsBooksQueue(csv_file)
         print(f" loaded {len(books)} reviews.")
         library = merge_authors(
             log=log,
@@ -207,11 +207,11 @@ def import_(
             templates=load_templates(log, books_folder, templates_folder, builtin_name),
         )
         library.dump(books)
-        print(
+        sys.stdout.write(
             f"\nAdded {library.stat.books_added} review files, "
             f"changed {library.stat.books_changed} review files, "
-            f"{library.stat.authors_added} author files.",
-            f"Renamed {library.stat.authors_renamed} authors.",
+            f"{library.stat.authors_added} author files. "
+            f"Renamed {library.stat.authors_renamed} authors.\n"
         )
     except Exception as exc:  # pylint: disable=broad-except
         print(f"\n{exc}")
@@ -237,6 +237,8 @@ def check(
     """
     try:
         log = Log(verbose)
+        if books_folder is not None:
+            books_folder = books_folder.resolve(strict=True)
         templates = load_templates(log, books_folder, templates_folder, builtin_name)
         library = Library(  # no `folder` argument: for template checks do not want changes in fs
             log=log, templates=templates
@@ -269,6 +271,7 @@ def merge(
     """
     try:
         log = Log(verbose)
+        books_folder = books_folder.resolve(strict=True)
         library = merge_authors(
             log=log,
             books_folder=books_folder,
@@ -300,6 +303,8 @@ def init(
     See https://andgineer.github.io/goodreads-export/en/ for details.
     """
     try:
+        if books_folder is not None:
+            books_folder = books_folder.resolve(strict=True)
         if books_folder is None and templates_folder is None:
             raise ValueError(
                 "You should specify `BOOKS_FOLDER` or `--templates-folder`"
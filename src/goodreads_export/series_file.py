@@ -12,6 +12,8 @@ from goodreads_export.templates import SeriesTemplate
 class SeriesFile(AuthoredFile):
     """Series' object."""
 
+    __slots__ = ("title",)
+
     title: str
 
     def __init__(self, *, title: Optional[str] = None, **kwargs: Any) -> None:
@@ -34,18 +36,15 @@ class SeriesFile(AuthoredFile):
 
     def parse(self) -> None:
         """Parse file content."""
-        assert self._content is not None, "Cannot parse None content"
-        if regex := self._get_template().content_regexes.choose_regex(self._content):
-            match = regex.compiled.search(self._content)
-            assert match, (
-                "impossible happened: after successful `search` in "
-                "`choose_regex` got `None` for search with same params"
-            )
+        content = self._content
+        assert content is not None, "Cannot parse None content"
+        if found := self._get_template().content_regexes.search(content):
+            regex, match = found
             self.title = match[regex.title_group]
             self.author = self.library.author_factory(match[regex.author_group])
         else:
             raise ParseError(
-                f"Cannot extract series information from file content:\n{self._content}"
+                f"Cannot extract series information from file content:\n{content}"
             )
 
     def is_file_name(self, file_name: Union[str, Path]) -> bool:
@@ -61,12 +60,13 @@ class SeriesFile(AuthoredFile):
         Create file from fields and after that parse it and compare parsed values
         with the initial fields
         """
+        template = self._get_template()
         fields_parsed = self.check_regexes(
             {
                 "Series title": {"value": lambda: self.title},
                 "Author name": {"value": lambda: self.author.name},
             },
-            self._get_template().content_regexes[0].regex,
+            template.content_regexes[0].regex,
         )
 
         # force file name render and check the result
@@ -74,16 +74,16 @@ class SeriesFile(AuthoredFile):
         series_file_name = self.file_name
         is_file_name = self.is_file_name(series_file_name)
         if not is_file_name:
-            print(
-                f"Rendered with template `{self._get_template().file_name_template}`)"
-            )
+            print(f"Rendered with template `{template.file_name_template}`)")
             print(
                 f"file name `{series_file_name}` is not recognized using the pattern:"
             )
-            print(f"{self._get_template().file_name_regexes[0].regex}")
+            print(f"{template.file_name_regexes[0].regex}")
 
         return fields_parsed and is_file_name
 
 
 class SeriesList(List[SeriesFile]):
     """List of SeriesFile objects."""
+
+    __slots__ = ()
@@ -12,11 +12,13 @@ class Stat:  # pylint: disable=too-few-public-methods
     skipped_unknown_files: int = 0
     series_added: int = 0
     authors_renamed: int = 0
-    unique_authors: Set[str] = set()
+
+    def __init__(self) -> None:
+        """Each statistics object counts its own unique authors."""
+        self.unique_authors: Set[str] = set()
 
     def register_author(self, author: str) -> bool:
         """Return True if the author is new."""
-        if author not in self.unique_authors:
-            self.unique_authors.add(author)
-            return True
-        return False
+        authors_num = len(self.unique_authors)
+        self.unique_authors.add(author)
+        return len(self.unique_authors) != authors_num
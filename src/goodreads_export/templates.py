@@ -3,8 +3,9 @@
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
 
 import jinja2
 from jinja2 import DebugUndefined
@@ -39,6 +40,7 @@ class RegEx:
     """Regular expression.
 
     Auto compile regex.
+    Compiled on creation so errors in user regexes are reported when templates load.
     """
 
     regex: str
@@ -103,11 +105,19 @@ class RegExList(List[RegExSubClass]):
 
     def choose_regex(self, content: str) -> Optional[RegExSubClass]:
         """Choose regex that matches the content."""
-        if content is not None:
-            for regex in self:
-                if regex.compiled.search(content) is not None:
-                    assert issubclass(regex.__class__, RegEx)
-                    return regex
+        if content is not None and (found := self.search(content)) is not None:
+            return found[0]
+        return None
+
+    def search(self, content: str) -> Optional[Tuple[RegExSubClass, "re.Match[str]"]]:
+        """Search the content with the first regex that matches it.
+
+        Return (regex, match) or None if no regex matches.
+        """
+        for regex in self:
+            if (match := regex.compiled.search(content)) is not None:
+                assert issubclass(regex.__class__, RegEx)
+                return regex, match
         return None
 
 
@@ -133,25 +143,36 @@ class FileTemplate:
 
     def __post_init__(self) -> None:
         """Split template to file name, optional link and body."""
-        object.__setattr__(
-            self, "file_name_template", self.template.split("\n", maxsplit=1)[0]
-        )
-        if self.template.split("\n", maxsplit=2)[1] != "":
-            file_link_template = self.template.split("\n", maxsplit=2)[1]
-            body_template = "\n".join(self.template.split("\n")[3:])
+        lines = self.template.split("\n")
+        object.__setattr__(self, "file_name_template", lines[0])
+        if lines[1] != "":
+            file_link_template = lines[1]
+            body_template = "\n".join(lines[3:])
         else:
             file_link_template = None
-            body_template = "\n".join(self.template.split("\n")[2:])
+            body_template = "\n".join(lines[2:])
         object.__setattr__(self, "file_link_template", file_link_template)
         object.__setattr__(self, "body_template", body_template)
 
+    @cached_property
+    def file_name_jinja(self) -> jinja2.Template:
+        """Compiled file name template."""
+        return self.jinja.from_string(self.file_name_template)
+
+    @cached_property
+    def file_link_jinja(self) -> jinja2.Template:
+        """Compiled link template."""
+        assert self.file_link_template is not None, "No link template to compile"
+        return self.jinja.from_string(self.file_link_template)
+
+    @cached_property
+    def body_jinja(self) -> jinja2.Template:
+        """Compiled body template."""
+        return self.jinja.from_string(self.body_template)
+
     def render_file_name(self, context: Dict[str, Any]) -> Path:
         """Render file name with context."""
-        return Path(
-            clean_file_name(
-                self.jinja.from_string(self.file_name_template).render(context)
-            )
-        )
+        return Path(clean_file_name(self.file_name_jinja.render(context)))
 
     def render_file_link(self, context: Dict[str, Any]) -> str:
         """Render link with context.
@@ -160,13 +181,11 @@ class FileTemplate:
         """
         if self.file_link_template is None:
             return Path(context["file_name"]).stem
-        return clean_file_name(
-            self.jinja.from_string(self.file_link_template).render(context)
-        )
+        return clean_file_name(self.file_link_jinja.render(context))
 
     def render_body(self, context: Dict[str, Any]) -> str:
         """Render file body with context."""
-        return self.jinja.from_string(self.body_template).render(context)
+        return self.body_jinja.render(context)
 
 
 @dataclass(frozen=True)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -132,3 +133,35 @@ def test_book_file_check():
         book_id="123",
         title="Title",
     ).check()
+
+
+@pytest.mark.parametrize(
+    "book_markdown, expected_series",
+    [
+        (
+            os.path.join("reviews", "Terry Pratchett - Mort (Discworld @4; Death @1).md"),
+            ["Discworld", "Death"],
+        ),
+        (
+            os.path.join(
+                "reviews",
+                "Terry Pratchett - The Light Fantastic (Discworld @2; Rincewind @2).md",
+            ),
+            ["Discworld", "Rincewind"],
+        ),
+    ],
+    indirect=["book_markdown"],
+)
+def test_book_file_details_parsed_on_access(book_markdown, expected_series):
+    content = book_markdown
+    library = Library()
+    author = library.author_factory(name="Author")
+    book_file = BookFile(library=library, author=author, content=content)
+    assert not book_file._details_parsed
+    assert book_file.series_titles == expected_series
+    assert book_file._details_parsed
+    expected_review = None
+    if found := library.templates.book.review_regexes.search(content):
+        regex, match = found
+        expected_review = match[regex.review_group].strip()
+    assert book_file.review == expected_review
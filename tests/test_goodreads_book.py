@@ -4,7 +4,9 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
+import goodreads_export.goodreads_book
 from goodreads_export.clean_file_name import clean_file_name
+from goodreads_export.goodreads_book import Book, GoodreadsBooks, GoodreadsBooksQueue
 from goodreads_export.main import main
 
 
@@ -55,3 +57,46 @@ def test_merge_only(test_case):
         )
         assert result.exit_code == 0, f"stdout: {result.output}"
         assert test_case.check("./books", test_case.merged_folder), test_case.diff
+
+
+@pytest.mark.parametrize("test_case", ["create"], indirect=True)
+def test_books_queue_reraises_producer_error(test_case, monkeypatch):
+    rows = []
+
+    def book_or_error(goodreads):
+        rows.append(goodreads)
+        if len(rows) == 2:
+            raise ValueError("Bad row")
+        return Book(goodreads)
+
+    monkeypatch.setattr(goodreads_export.goodreads_book, "Book", book_or_error)
+    books = iter(GoodreadsBooksQueue(str(test_case.csv)))
+    assert next(books).book_id == str(rows[0]["Book Id"])
+    with pytest.raises(ValueError, match="Bad row"):
+        next(books)
+
+
+@pytest.mark.parametrize("test_case", ["create"], indirect=True)
+def test_books_queue_empty_export(test_case, tmp_path):
+    header = test_case.csv.read_text(encoding="utf8").split("\n", maxsplit=1)[0]
+    csv_file = tmp_path / "goodreads_library_export.csv"
+    csv_file.write_text(f"{header}\n", encoding="utf8")
+    books = GoodreadsBooksQueue(str(csv_file))
+    assert len(books) == 0
+    assert list(books) == []
+    with pytest.raises(RuntimeError, match="only once"):
+        list(books)
+
+
+@pytest.mark.parametrize("test_case", ["create"], indirect=True)
+def test_books_empty_author(test_case, tmp_path):
+    lines = test_case.csv.read_text(encoding="utf8").split("\n")
+    header = lines[0].split(",")
+    assert header[2] == "Author"
+    row = lines[1].split(",")
+    row[2] = ""
+    csv_file = tmp_path / "goodreads_library_export.csv"
+    csv_file.write_text("\n".join([lines[0], ",".join(row)]) + "\n", encoding="utf8")
+    books = list(GoodreadsBooks(str(csv_file)))
+    assert len(books) == 1
+    assert not isinstance(books[0].author, str)
@@ -1,10 +1,13 @@
 from os import mkdir
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
-from goodreads_export.library import Library
+import goodreads_export.library
+from goodreads_export.library import Library, read_files
 from goodreads_export.log import Log
+from goodreads_export.stat import Stat
 
 
 def test_library_load(test_case):
@@ -36,3 +39,64 @@ def test_library_merge(test_case):
         test_case.copy_existed(folder)
         library = Library(folder, log)
         library.merge_author_names()
+
+
+def test_library_load_skips_unknown_author_file(monkeypatch):
+    monkeypatch.setattr(Library, "stat", Stat())  # stat is shared by all libraries
+    log = Log()
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        mkdir("books")
+        folder = Path("books")
+        (folder / "authors").mkdir()
+        (folder / "authors" / "Unknown.md").write_text("Not an author", encoding="utf8")
+        library = Library(folder, log)
+    assert library.authors == {}
+    assert library.stat.skipped_unknown_files == 1
+
+
+@pytest.mark.parametrize("test_case", ["update"], indirect=True)
+def test_library_load_duplicate_book_id(test_case):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        mkdir("books")
+        folder = Path("books")
+        test_case.copy_existed(folder)
+        book_file_name = "Pratchett Terry - Mort (Discworld @4; Death @1).md"
+        (folder / "reviews" / f"copy of {book_file_name}").write_text(
+            (folder / "reviews" / book_file_name).read_text(encoding="utf8"),
+            encoding="utf8",
+        )
+        with pytest.raises(ValueError, match="Duplicate book ID"):
+            Library(folder, Log())
+
+
+@pytest.mark.parametrize("test_case", ["update"], indirect=True)
+def test_library_load_same_book_in_two_folders(test_case):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        mkdir("books")
+        folder = Path("books")
+        test_case.copy_existed(folder)
+        (folder / "toread").mkdir()
+        book_file_name = "Pratchett Terry - Mort (Discworld @4; Death @1).md"
+        (folder / "toread" / book_file_name).write_text(
+            (folder / "reviews" / book_file_name).read_text(encoding="utf8"),
+            encoding="utf8",
+        )
+        library = Library(folder, Log())
+    assert len(library.books) == len(test_case.meta["existed"]["books"])
+
+
+@pytest.mark.parametrize("min_files", [0, 1000])
+def test_read_files(monkeypatch, tmp_path, min_files):
+    monkeypatch.setattr(goodreads_export.library, "PARALLEL_READ_MIN_FILES", min_files)
+    for idx in range(3):
+        (tmp_path / f"{idx}.md").write_text(f"content {idx}", encoding="utf8")
+    (tmp_path / "skipped.txt").write_text("skipped", encoding="utf8")
+    (tmp_path / "folder.md").mkdir()
+    files = read_files(tmp_path, ".md")
+    assert sorted((entry.name, content) for entry, content in files) == [
+        (f"{idx}.md", f"content {idx}") for idx in range(3)
+    ]
+    assert read_files(tmp_path / "missing", ".md") == []
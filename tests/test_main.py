@@ -76,6 +76,17 @@ def test_main_no_csv():
     assert "not found" in result.output
 
 
+def test_main_no_books_folder():
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            main,
+            ["merge", "fake"],
+        )
+    assert result.exit_code == 1, f"stdout: {result.output}"
+    assert "No such file or directory" in result.output
+
+
 def test_main_merge():
     runner = CliRunner()
     with runner.isolated_filesystem():
@@ -1,3 +1,6 @@
+from pathlib import Path
+
+from goodreads_export.book_file import BookFile
 from goodreads_export.library import Library
 from goodreads_export.series_file import SeriesFile
 
@@ -6,3 +9,48 @@ def test_series_file_check():
     library = Library()
     author = library.author_factory(name="Author")
     assert SeriesFile(library=library, author=author, title="Title").check()
+
+
+def test_series_file_create_keeps_existing(tmp_path):
+    library = Library()
+    author = library.author_factory(name="Author")
+    series = SeriesFile(library=library, author=author, title="Title", folder=tmp_path)
+    assert series.create()
+    series.path.write_text("edited", encoding="utf8")
+    assert not series.create()
+    assert series.path.read_text(encoding="utf8") == "edited"
+
+
+def test_series_file_rename_author_same_file(tmp_path):
+    library = Library()
+    old_author = library.author_factory(name="terry pratchett")
+    series = SeriesFile(library=library, author=old_author, title="Title", folder=tmp_path)
+    series.write()
+    old_path = series.path
+    new_file_name = str(series.file_name).replace("terry pratchett", "Terry Pratchett")
+    # the new name refers to the same file, as with case-insensitive file systems
+    (tmp_path / new_file_name).symlink_to(old_path)
+    series.rename_author("Terry Pratchett")
+    assert series.path == tmp_path / new_file_name
+    assert "Terry Pratchett" in series.path.read_text(encoding="utf8")
+
+
+def test_book_file_rename_author_to_id_suffixed_name(tmp_path):
+    library = Library()
+    old_author = library.author_factory(name="Synonym")
+    book = BookFile(
+        library=library,
+        author=old_author,
+        title="Mort",
+        book_id="123",
+        folder=tmp_path,
+        file_name=Path("Primary - Mort - 123.md"),
+    )
+    book.write()
+    old_path = book.path
+    (tmp_path / "Primary - Mort.md").write_text("other book", encoding="utf8")
+    # the new name collides, so the book ID suffix gives back the old file name
+    book.rename_author("Primary")
+    assert book.path == old_path
+    assert "Primary" in book.path.read_text(encoding="utf8")
+    assert (tmp_path / "Primary - Mort.md").read_text(encoding="utf8") == "other book"
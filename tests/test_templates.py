@@ -1,3 +1,7 @@
+import re
+
+import pytest
+
 from goodreads_export.templates import DEFAULT_BUILTIN_TEMPLATE, RegEx, RegExList, TemplatesLoader
 
 
@@ -17,3 +21,12 @@ def test_multi_regex():
     )
     assert regex_a == regex_list.choose_regex("a")
     assert regex_b == regex_list.choose_regex("b")
+    found = regex_list.search("xb")
+    assert found is not None
+    assert found[0] == regex_b and found[1][0] == "b"
+    assert regex_list.search("c") is None
+
+
+def test_regex_error_on_creation():
+    with pytest.raises(re.error):
+        RegEx(regex=r"(unclosed")